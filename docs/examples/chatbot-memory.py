@@ -14,7 +14,18 @@ import os
 from datetime import datetime
 import time
 
-rb = RecallBricks(os.getenv('RECALLBRICKS_API_KEY'))
+def context_key(context):
+    """Ignore the turn number so a repeated message reuses its cached prediction"""
+    return '\n'.join(
+        line for line in context.splitlines()
+        if not line.strip().startswith('Turn:')
+    )
+
+rb = RecallBricks(
+    os.getenv('RECALLBRICKS_API_KEY'),
+    predict_cache=True,          # Reuse predictions for near-identical contexts
+    predict_context_key=context_key
+)
 
 # Simulated user sessions
 user_id = 'user_12345'
@@ -86,6 +97,9 @@ def main():
         # ============================================
         print('=== Session End ===\n')
 
+        # Make sure queued conversation turns are stored before reading them back
+        rb.flush()
+
         conversation_memories = rb.memories.search(
             query='conversation',
             metadata={
@@ -144,7 +158,7 @@ def main():
         # ============================================
         print('✅ Chatbot Memory Example Completed!\n')
         print('Key features demonstrated:')
-        print('  • Store conversation history automatically')
+        print('  • Store conversation history in the background')
         print('  • Retrieve relevant context using semantic search')
         print('  • Use predictive recall for smart suggestions')
         print('  • Maintain user preferences across sessions')
@@ -180,31 +194,29 @@ def handle_message(user_message, turn_number):
 
     print(f'\nBot: "{bot_response}"')
 
-    # 3. Store this exchange as memory
-    rb.memories.create_batch([
-        {
-            'content': f'User asked: "{user_message}"',
-            'metadata': {
-                'user_id': user_id,
-                'session_id': session_id,
-                'turn': turn_number,
-                'type': 'user_message',
-                'timestamp': datetime.utcnow().isoformat()
-            }
-        },
-        {
-            'content': f'Bot responded: "{bot_response}"',
-            'metadata': {
-                'user_id': user_id,
-                'session_id': session_id,
-                'turn': turn_number,
-                'type': 'bot_message',
-                'timestamp': datetime.utcnow().isoformat()
-            }
+    # 3. Queue this exchange for storage (doesn't block the turn)
+    rb.memories.create_async(
+        content=f'User asked: "{user_message}"',
+        metadata={
+            'user_id': user_id,
+            'session_id': session_id,
+            'turn': turn_number,
+            'type': 'user_message',
+            'timestamp': datetime.utcnow().isoformat()
         }
-    ])
+    )
+    rb.memories.create_async(
+        content=f'Bot responded: "{bot_response}"',
+        metadata={
+            'user_id': user_id,
+            'session_id': session_id,
+            'turn': turn_number,
+            'type': 'bot_message',
+            'timestamp': datetime.utcnow().isoformat()
+        }
+    )
 
-    print('\n✓ Conversation stored in memory')
+    print('\n✓ Conversation queued for memory')
 
 def generate_response(message, context):
     """Simulate response generation"""
@@ -0,0 +1,149 @@
+"""
+Local Index Benchmark Example
+
+This example demonstrates:
+- Syncing a namespace for local search
+- Building HNSW and IVF-PQ approximate indexes
+- Measuring recall@k and footprint against exact search
+- Tuning the recall/latency knob
+"""
+
+from recallbricks import RecallBricks
+import os
+
+rb = RecallBricks(os.getenv('RECALLBRICKS_API_KEY'))
+
+NAMESPACE = os.getenv('RECALLBRICKS_NAMESPACE', 'support_kb')
+INDEX_DIR = os.getenv('RECALLBRICKS_INDEX_DIR', '/tmp/recallbricks')
+
+# Representative queries from your application
+sample_queries = [
+    'How do I reset my password?',
+    'refund policy for annual plans',
+    'API rate limits on the free tier',
+    'export my data to CSV',
+    'two-factor authentication setup',
+    'billing address change',
+    'webhook retries and timeouts',
+    'delete my account'
+]
+
+def main():
+    try:
+        print('📏 RecallBricks Local Index Benchmark\n')
+
+        # ============================================
+        # SYNC: Exact index (baseline)
+        # ============================================
+        print('1. Syncing namespace (exact index)...\n')
+
+        exact = rb.local.sync(
+            namespace=NAMESPACE,
+            path=f'{INDEX_DIR}/{NAMESPACE}-exact',
+            index='exact'
+        )
+
+        print(f'✓ Synced {exact.size} memories\n')
+
+        # ============================================
+        # HNSW: Sweep ef_search
+        # ============================================
+        print('2. HNSW (low latency)\n')
+
+        hnsw = rb.local.sync(
+            namespace=NAMESPACE,
+            path=f'{INDEX_DIR}/{NAMESPACE}-hnsw',
+            index='hnsw',
+            hnsw_m=16,
+            hnsw_ef_construction=200
+        )
+
+        print(f'  {"ef_search":>10} {"recall@10":>10} {"p50 (ms)":>10} {"p99 (ms)":>10}')
+        for ef_search in [16, 32, 64, 128, 256]:
+            report = hnsw.benchmark(queries=sample_queries, k=10, ef_search=ef_search)
+            print(f'  {ef_search:>10} {report.recall:>10.3f} {report.p50_ms:>10.2f} {report.p99_ms:>10.2f}')
+        print(f'\n  Exact p50: {report.exact_p50_ms:.2f}ms\n')
+
+        # ============================================
+        # IVF-PQ: Sweep nprobe
+        # ============================================
+        print('3. IVF-PQ (small footprint)\n')
+
+        ivf_pq = rb.local.sync(
+            namespace=NAMESPACE,
+            path=f'{INDEX_DIR}/{NAMESPACE}-ivf-pq',
+            index='ivf_pq',
+            ivf_nlist=1024,
+            pq_m=96
+        )
+
+        print(f'  {"nprobe":>10} {"recall@10":>10} {"p50 (ms)":>10} {"p99 (ms)":>10}')
+        for nprobe in [4, 8, 16, 32, 64]:
+            report = ivf_pq.benchmark(queries=sample_queries, k=10, nprobe=nprobe)
+            print(f'  {nprobe:>10} {report.recall:>10.3f} {report.p50_ms:>10.2f} {report.p99_ms:>10.2f}')
+        print()
+
+        # ============================================
+        # FOOTPRINT: Compare index sizes
+        # ============================================
+        print('4. Index Footprint\n')
+
+        for name, index in [('exact', exact), ('hnsw', hnsw), ('ivf_pq', ivf_pq)]:
+            print(f'  {name:>8}: {index.memory_bytes / 1024 / 1024:.1f} MB in memory')
+        print()
+
+        # ============================================
+        # VERIFY: Same top result as exact search
+        # ============================================
+        print('5. Spot Check Against Exact Search\n')
+
+        # Compare within the same namespace; memories.search() covers every
+        # memory for the key, so it can legitimately return a different top hit
+        query = sample_queries[0]
+        baseline = exact.search(query=query, limit=1)
+        approximate = hnsw.search(query=query, limit=1)
+
+        if baseline and approximate:
+            match = baseline[0].id == approximate[0].id
+            print(f'  Query: "{query}"')
+            print(f'  Exact: {baseline[0].id} ({baseline[0].score:.3f})')
+            print(f'  HNSW:  {approximate[0].id} ({approximate[0].score:.3f})')
+            print(f'  {"✓ Same top result" if match else "✗ Different top result (try a higher ef_search)"}\n')
+
+        # ============================================
+        # Summary
+        # ============================================
+        print('✅ Benchmark Completed!\n')
+        print('Key takeaways:')
+        print('  • Exact search is the baseline: perfect recall, latency grows with size')
+        print('  • HNSW gives the lowest latency; raise ef_search for better recall')
+        print('  • IVF-PQ uses the least memory; raise nprobe for better recall')
+        print('  • Pick the smallest knob value that meets your recall target')
+
+    except Exception as error:
+        print(f'❌ Error: {str(error)}')
+        if hasattr(error, 'code'):
+            print(f'   Code: {error.code}')
+        exit(1)
+
+if __name__ == '__main__':
+    main()
+
+"""
+To run this example:
+
+1. Install dependencies:
+   pip install 'recallbricks[local]' python-dotenv
+
+2. Set your API key and namespace:
+   export RECALLBRICKS_API_KEY='rb_live_your_key_here'
+   export RECALLBRICKS_NAMESPACE='support_kb'
+
+3. Run the script:
+   python local-index-benchmark.py
+
+Expected output:
+  - recall@10 and p50/p99 latency for each ef_search and nprobe value
+  - In-memory footprint of each index type
+  - HNSW top result compared with exact search
+"""
@@ -23,44 +23,43 @@ def main():
         # ============================================
         print('1. Registering Specialized Agents\n')
 
-        web_researcher = rb.collaboration.register_agent(
-            agent_id='web-researcher',
-            role='research',
-            capabilities=['web_search', 'fact_checking', 'source_verification'],
-            metadata={
-                'team': 'research',
-                'specialization': 'web_intelligence'
-            }
-        )
-
-        print(f'✓ Registered: {web_researcher.agent_id}')
-        print(f'  Role: {web_researcher.role}')
-        print(f'  Initial Reputation: {web_researcher.reputation_score}\n')
-
-        data_analyst = rb.collaboration.register_agent(
-            agent_id='data-analyst',
-            role='analysis',
-            capabilities=['data_processing', 'statistical_analysis', 'pattern_detection'],
-            metadata={
-                'team': 'analytics',
-                'specialization': 'quantitative_analysis'
+        # One idempotent upsert for the whole fleet; safe to re-run on startup
+        registration = rb.collaboration.register_agents([
+            {
+                'agent_id': 'web-researcher',
+                'role': 'research',
+                'capabilities': ['web_search', 'fact_checking', 'source_verification'],
+                'metadata': {
+                    'team': 'research',
+                    'specialization': 'web_intelligence'
+                }
+            },
+            {
+                'agent_id': 'data-analyst',
+                'role': 'analysis',
+                'capabilities': ['data_processing', 'statistical_analysis', 'pattern_detection'],
+                'metadata': {
+                    'team': 'analytics',
+                    'specialization': 'quantitative_analysis'
+                }
+            },
+            {
+                'agent_id': 'market-researcher',
+                'role': 'market_intelligence',
+                'capabilities': ['market_analysis', 'competitive_intelligence', 'trend_forecasting'],
+                'metadata': {
+                    'team': 'research',
+                    'specialization': 'market_trends'
+                }
             }
-        )
-
-        print(f'✓ Registered: {data_analyst.agent_id}')
-        print(f'  Role: {data_analyst.role}\n')
+        ])
 
-        market_researcher = rb.collaboration.register_agent(
-            agent_id='market-researcher',
-            role='market_intelligence',
-            capabilities=['market_analysis', 'competitive_intelligence', 'trend_forecasting'],
-            metadata={
-                'team': 'research',
-                'specialization': 'market_trends'
-            }
-        )
+        for agent in registration.agents:
+            print(f'✓ Registered: {agent.agent_id}')
+            print(f'  Role: {agent.role}')
+            print(f'  Reputation: {agent.reputation_score}\n')
 
-        print(f'✓ Registered: {market_researcher.agent_id}\n')
+        print(f'  Created: {len(registration.created)}, Unchanged: {len(registration.unchanged)}\n')
 
         # ============================================
         # CONTRIBUTION: Agents create memories
@@ -140,8 +139,11 @@ def main():
 
         agents = ['web-researcher', 'data-analyst', 'market-researcher']
 
+        # One request for the whole team
+        reputations = rb.collaboration.get_reputations(agents)
+
         for agent_id in agents:
-            reputation = rb.collaboration.get_reputation(agent_id)
+            reputation = reputations[agent_id]
 
             print(f'{agent_id}:')
             print(f'  Reputation Score: {reputation.reputation_score * 100:.1f}%')
@@ -154,26 +156,13 @@ def main():
         # ============================================
         print('4. Collaborative Knowledge Synthesis\n')
 
+        # Select agents instead of listing memory IDs; the server reads
+        # their memories and current reputations itself
         synthesis = rb.collaboration.synthesize(
-            agent_memories=[
-                {
-                    'agent_id': 'web-researcher',
-                    'memories': [m.id for m in web_memories],
-                    'reputation': 0.94
-                },
-                {
-                    'agent_id': 'data-analyst',
-                    'memories': [m.id for m in data_memories],
-                    'reputation': 0.91
-                },
-                {
-                    'agent_id': 'market-researcher',
-                    'memories': [m.id for m in market_memories],
-                    'reputation': 0.88
-                }
-            ],
+            agents={'agent_ids': agents},
             topic='AI developer tools adoption and market trends',
-            min_confidence=0.85
+            min_confidence=0.85,
+            limit=5
         )
 
         print('Synthesized Insights:')
@@ -203,6 +192,19 @@ def main():
             print(f'  {index + 1}. {memory.content}')
             print(f'     Agent: {memory.agent_id} ({memory.agent_reputation * 100:.1f}%)\n')
 
+        # Relevant memories from top-tier agents, filtered in the search itself
+        trusted_results = rb.memories.search(
+            query='AI developer tools adoption',
+            min_agent_reputation=0.9,
+            min_confidence=0.85,
+            limit=3
+        )
+
+        print('Relevant memories from high-reputation agents:')
+        for result in trusted_results:
+            print(f'  • {result.content} ({result.agent_id}, score {result.score:.2f})')
+        print()
+
         # ============================================
         # COMPARISON: Compare agent performance
         # ============================================
@@ -246,6 +248,30 @@ def main():
 
         print('✓ Updated web-researcher with new capabilities\n')
 
+        # The cached profile is replaced by the update, no refetch needed
+        profile = rb.collaboration.profile('web-researcher')
+        print(f'  Capabilities: {", ".join(profile.capabilities)}\n')
+
+        # ============================================
+        # ROUTING: Dispatch a query to the best agent
+        # ============================================
+        print('8. Routing a Query\n')
+
+        # Copy the registry locally; updates above are already applied
+        rb.collaboration.sync_agents()
+
+        query = 'What are the latest AI tool market statistics?'
+        route = rb.collaboration.route(query, k=2)
+
+        print(f'Query: "{query}"')
+        print(f'Matched capabilities: {", ".join(route.capabilities)}\n')
+        for agent in route.agents:
+            print(f'  → {agent.agent_id} (coverage {agent.coverage * 100:.0f}%, reputation {agent.reputation_score * 100:.1f}%)')
+
+        # Routing by capability runs entirely in-process
+        monitor = rb.collaboration.route(['real_time_monitoring'], k=1, local=True)
+        print(f'\nReal-time monitoring → {monitor.agents[0].agent_id}\n')
+
         # ============================================
         # Summary
         # ============================================
@@ -244,10 +244,9 @@ async function main() {
 
     console.log(`Query: "${query}"\n`);
 
-    // Find best agent for this query
-    const bestAgent = comparison.agents.find(a =>
-      a.agentId === 'market-researcher'  // Specialized for market data
-    );
+    // Find best agent for this query by capability and reputation
+    const route = await rb.collaboration.route({ query, k: 1 });
+    const bestAgent = route.agents[0];
 
     if (bestAgent) {
       const agentMemories = await rb.collaboration.getAgentMemories({
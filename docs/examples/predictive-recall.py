@@ -110,18 +110,15 @@ def main():
         # ============================================
         print('4. Applying Predicted Strategy\n')
 
-        # Get prediction
-        prediction = rb.metacognition.predict(
-            context='User wants Python SDK documentation'
-        )
-
-        # Apply the suggested strategy to actual search
+        # Let the server choose the strategy and search in one request
         results = rb.memories.search(
             query='Python SDK',
-            weights=prediction.suggested_strategy.weights,
-            limit=prediction.suggested_strategy.limit
+            strategy='auto',
+            context='User wants Python SDK documentation'
         )
 
+        print(f'Applied Strategy: semantic={results.strategy.weights.semantic}, recency={results.strategy.weights.recency}, limit={results.strategy.limit}\n')
+
         print('Search Results (using AI-suggested strategy):')
         for index, result in enumerate(results):
             print(f'  {index + 1}. "{result.content}"')
@@ -132,26 +129,24 @@ def main():
         # ============================================
         print('5. Hybrid: Predictions + Traditional Search\n')
 
-        hybrid_prediction = rb.metacognition.predict(
-            context='User asking about rate limits'
+        # Predict and search concurrently; use high-confidence (>90%)
+        # predictions if they arrive within budget, otherwise search results
+        hybrid = rb.recall(
+            context='User asking about rate limits',
+            query='rate limits',
+            min_confidence=0.9,
+            budget_ms=300,
+            limit=3
         )
 
-        # Use high-confidence predictions
-        high_confidence = [
-            m for m in hybrid_prediction.suggested_memories
-            if m.confidence > 0.9
-        ]
-
-        print(f'High-confidence predictions (>90%): {len(high_confidence)}')
-
-        if high_confidence:
+        if hybrid.source == 'prediction':
             print('Using predicted memories directly:')
-            for i, mem in enumerate(high_confidence):
-                print(f'  {i + 1}. {mem.content}')
         else:
-            print('No high-confidence predictions, falling back to search...')
-            fallback_results = rb.memories.search(query='rate limits', limit=3)
-            print(f'Found {len(fallback_results)} results via search.')
+            print('No high-confidence predictions in time, used search results:')
+
+        for i, mem in enumerate(hybrid.memories):
+            print(f'  {i + 1}. {mem.content}')
+        print(f'Answered in {hybrid.latency_ms:.0f}ms via {hybrid.source}')
         print()
 
         # ============================================
@@ -206,6 +201,7 @@ def main():
         print('Key takeaways:')
         print('  • Predictions save you from manually crafting queries')
         print('  • Confidence scores let you decide when to trust predictions')
+        print('  • recall() races predictions against search within a latency budget')
         print('  • Rich context = better predictions')
         print('  • Suggested strategies optimize your searches automatically')
         print('  • Feedback makes the system smarter over time')
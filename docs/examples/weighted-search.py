@@ -103,8 +103,8 @@ def main():
         # ============================================
         print('4. AI-Optimized Weights\n')
 
-        patterns = rb.metacognition.get_patterns()
-        optimal_weights = patterns.query_patterns.optimal_weights
+        # Read from the client's local patterns snapshot (refreshed hourly in the background)
+        optimal_weights = rb.optimal_weights()
 
         print('AI-Learned Optimal Weights:')
         print(f'  Semantic: {optimal_weights.semantic}')
@@ -215,13 +215,15 @@ def main():
             {'name': 'Recency-Heavy', 'weights': {'semantic': 0.1, 'recency': 0.9}}
         ]
 
-        for strategy in strategies:
-            results = rb.memories.search(
-                query=query,
-                weights=strategy['weights'],
-                limit=1
-            )
+        # One request: fetch candidates once, re-rank locally per strategy
+        ranked = rb.memories.search_multi(
+            query=query,
+            weight_profiles=[strategy['weights'] for strategy in strategies],
+            limit=1,
+            candidates=50  # Wide pool so each strategy can pick a different top result
+        )
 
+        for strategy, results in zip(strategies, ranked):
             print(f"{strategy['name']}:")
             print(f"  Weights: Semantic {strategy['weights']['semantic']}, Recency {strategy['weights']['recency']}")
             if results:
@@ -239,6 +241,7 @@ def main():
         print('  • AI-optimized: Let RecallBricks learn optimal weights')
         print('  • Different use cases need different strategies')
         print('  • Weights dramatically affect which results rank highest')
+        print('  • search_multi() compares strategies with a single request')
 
     except Exception as error:
         print(f'❌ Error: {str(error)}')